@@ -60,6 +60,9 @@ MLFLOW_REGISTERED_MODELS = None
 MLFLOW_ARTIFACTS_COUNT = None
 MLFLOW_API_CALLS = None
 
+# MLflow client - created once and reused by every metrics update
+MLFLOW_CLIENT = None
+
 
 def initialize_metrics():
     """Initialize Prometheus metrics safely"""
@@ -108,16 +111,26 @@ def initialize_metrics():
         return False
 
 
+def get_mlflow_client():
+    """Return the shared MlflowClient, creating it on first use"""
+    global MLFLOW_CLIENT
+
+    if MLFLOW_CLIENT is None:
+        tracking_uri = os.environ.get(
+            "MLFLOW_BACKEND_STORE_URI", "sqlite:////mlruns/mlflow.db"
+        )
+        MLFLOW_CLIENT = MlflowClient(tracking_uri=tracking_uri)
+
+    return MLFLOW_CLIENT
+
+
 def update_metrics():
     """Update Prometheus metrics"""
     if not PROMETHEUS_AVAILABLE or not MLFLOW_RUNNING_EXPERIMENTS:
         return
 
     try:
-        tracking_uri = os.environ.get(
-            "MLFLOW_BACKEND_STORE_URI", "sqlite:////mlruns/mlflow.db"
-        )
-        client = MlflowClient(tracking_uri=tracking_uri)
+        client = get_mlflow_client()
 
         # Get experiments
         experiments = client.search_experiments()
@@ -134,11 +147,18 @@ def update_metrics():
             if MLFLOW_REGISTERED_MODELS is not None:
                 MLFLOW_REGISTERED_MODELS.set(0)
 
-        # Get total runs across all experiments
+        # Get total runs across all experiments (one paged query, not one per experiment)
         total_run_count = 0
-        for exp in experiments:
-            runs = client.search_runs(experiment_ids=[exp.experiment_id])
+        experiment_ids = [exp.experiment_id for exp in experiments]
+        page_token = None
+        while experiment_ids:
+            runs = client.search_runs(
+                experiment_ids=experiment_ids, page_token=page_token
+            )
             total_run_count += len(runs)
+            page_token = runs.token
+            if not page_token:
+                break
 
         if MLFLOW_TOTAL_RUNS is not None:
             MLFLOW_TOTAL_RUNS.set(total_run_count)
@@ -149,8 +169,9 @@ def update_metrics():
                 "MLFLOW_DEFAULT_ARTIFACT_ROOT", "/mlartifacts"
             )
             if os.path.exists(artifact_root):
+                # Sum per-directory file counts as they stream in (no intermediate list)
                 artifact_count = sum(
-                    [len(files) for _, _, files in os.walk(artifact_root)]
+                    len(files) for _, _, files in os.walk(artifact_root)
                 )
                 if MLFLOW_ARTIFACTS_COUNT is not None:
                     MLFLOW_ARTIFACTS_COUNT.set(artifact_count)
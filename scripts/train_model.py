@@ -44,7 +44,7 @@ def main():
         print("\n3️⃣ 데이터 기본 정보...")
         import pandas as pd
 
-        df = pd.read_csv(data_file)
+        df = pd.read_csv(data_file, usecols=["averageRating"])
         print(f"✅ 데이터 로드: {len(df):,}개 영화")
         print(
             f"   평점 범위: {df['averageRating'].min():.1f} ~ {df['averageRating'].max():.1f}"
@@ -8,6 +8,7 @@ import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
 import pandas as pd
 
 from src.data.data_loader import IMDbDataLoader
@@ -38,12 +39,15 @@ def validate_imdb_data():
     print(f"최저 평점: {rating_stats['min']:.1f}")
     print(f"중간값: {rating_stats['50%']:.2f}")
 
-    # 평점 분포
+    # 평점 분포 (한 번만 정렬한 뒤 searchsorted로 구간(양 끝 포함) 개수 계산)
+    # dropna 복사 없이 제자리 정렬 - NaN은 끝으로 정렬되어 어느 구간에도 포함되지 않음
     print(f"\n평점 분포:")
+    sorted_ratings = movies_df["averageRating"].to_numpy(dtype=np.float64, copy=True)
+    sorted_ratings.sort()
     for rating in range(1, 11):
-        count = len(
-            movies_df[movies_df["averageRating"].between(rating - 0.5, rating + 0.5)]
-        )
+        count = np.searchsorted(
+            sorted_ratings, rating + 0.5, side="right"
+        ) - np.searchsorted(sorted_ratings, rating - 0.5, side="left")
         print(f"  {rating}점대: {count:,} 영화")
 
     print("\n" + "=" * 60)
@@ -1,4 +1,5 @@
 import logging
+import random
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -281,6 +282,9 @@ async def predict_batch_movies(request: BatchPredictionRequest):
         evaluator = get_model_evaluator()
         predictions = []
 
+        # 배치 내 모든 결과에 동일한 요청 시각 사용 (항목마다 datetime.now() 호출 방지)
+        batch_timestamp = datetime.now().isoformat()
+
         for i, text in enumerate(request.texts):
             try:
                 # 간단한 더미 데이터 생성 (실제로는 텍스트 파싱 필요)
@@ -312,7 +316,6 @@ async def predict_batch_movies(request: BatchPredictionRequest):
                         base_rating += 0.1
                         
                     # 개별 영화마다 약간의 변화 추가
-                    import random
                     base_rating += random.uniform(-0.3, 0.3)
                     
                     # 범위 제한
@@ -326,7 +329,7 @@ async def predict_batch_movies(request: BatchPredictionRequest):
                             text=text,
                             sentiment=sentiment,
                             confidence=confidence,
-                            timestamp=datetime.now().isoformat(),
+                            timestamp=batch_timestamp,
                             # Enhanced fields for fallback
                             predicted_rating=round(predicted_rating, 2),
                             model_version="fallback-v1.0",
@@ -351,7 +354,7 @@ async def predict_batch_movies(request: BatchPredictionRequest):
                             text=text,
                             sentiment=sentiment,
                             confidence=confidence,
-                            timestamp=datetime.now().isoformat(),
+                            timestamp=batch_timestamp,
                             # Enhanced fields for normal prediction
                             predicted_rating=round(predicted_rating, 2),
                             model_version="1.0.0",
@@ -374,7 +377,7 @@ async def predict_batch_movies(request: BatchPredictionRequest):
                         text=text,
                         sentiment="neutral",
                         confidence=0.3,
-                        timestamp=datetime.now().isoformat(),
+                        timestamp=batch_timestamp,
                         # Enhanced fields for error case
                         predicted_rating=5.0,  # 중간값
                         model_version="error-fallback",
@@ -551,10 +554,14 @@ def load_model_at_startup():
             # "latest_model.joblib"
 
         ]
+
+        # models 디렉토리는 한 번만 조회하고 이후 존재 확인/검색은 이 목록으로 처리
+        joblib_files = list(models_dir.glob("*.joblib"))
+        joblib_names = {f.name for f in joblib_files}
         
         for packaged_model in packaged_models:
             packaged_path = models_dir / packaged_model
-            if packaged_path.exists():
+            if packaged_model in joblib_names:
                 try:
                     logger.info(f"🐳 Found packaged model: {packaged_model}")
                     model_evaluator = ModelEvaluator()
@@ -572,9 +579,12 @@ def load_model_at_startup():
                     continue
 
         # 🎯 PRIORITY 2: Look for latest trained model (development/production)
-        model_files = list(models_dir.glob("*forest*.joblib"))
-        model_files.extend(list(models_dir.glob("*regressor*.joblib")))
-        model_files.extend(list(models_dir.glob("*model*.joblib")))
+        model_files = [
+            f
+            for keyword in ("forest", "regressor", "model")
+            for f in joblib_files
+            if keyword in f.stem
+        ]
         
         # Filter out packaged models from search
         model_files = [f for f in model_files if f.name not in packaged_models]
@@ -643,13 +653,16 @@ def get_model_status():
         }
         
         if models_dir.exists():
-            # List all model files
-            all_models = list(models_dir.glob("*.joblib")) + list(models_dir.glob("*.pkl"))
+            # List all model files (one directory listing, split by extension)
+            all_files = list(models_dir.iterdir())
+            all_models = [f for f in all_files if f.suffix == ".joblib"]
+            all_models += [f for f in all_files if f.suffix == ".pkl"]
             status["available_models"] = [f.name for f in all_models]
             
             # Identify packaged models
+            available_names = set(status["available_models"])
             packaged_names = ["cicd_default_model.joblib", "docker_model.joblib", "cicd_linear_model.joblib"]
-            status["packaged_models"] = [name for name in packaged_names if (models_dir / name).exists()]
+            status["packaged_models"] = [name for name in packaged_names if name in available_names]
         
         if model_evaluator is not None:
             try:
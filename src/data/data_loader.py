@@ -1,6 +1,6 @@
-import gzip
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -21,6 +21,9 @@ class IMDbDataLoader:
         "title_ratings": "https://datasets.imdbws.com/title.ratings.tsv.gz",
     }
 
+    # 다운로드 스트리밍 청크 크기 (1 MiB)
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
     def __init__(self, data_dir: str = "data/raw"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -47,14 +50,18 @@ class IMDbDataLoader:
 
         total_size = int(response.headers.get("content-length", 0))
         downloaded = 0
+        last_percent = None
 
+        # 큰 청크(1 MiB)로 읽고, 진행률은 표시값이 바뀔 때만 출력
         with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
                 downloaded += len(chunk)
                 if total_size > 0:
-                    percent = (downloaded / total_size) * 100
-                    print(f"\r진행률: {percent:.1f}%", end="", flush=True)
+                    percent = round((downloaded / total_size) * 100, 1)
+                    if percent != last_percent:
+                        print(f"\r진행률: {percent:.1f}%", end="", flush=True)
+                        last_percent = percent
 
         print()  # 새 줄
         logger.info(f"다운로드 완료: {filepath}")
@@ -68,8 +75,15 @@ class IMDbDataLoader:
 
         logger.info(f"파일 로드 중: {filepath}")
 
-        with gzip.open(filepath, "rt", encoding="utf-8") as f:
-            df = pd.read_csv(f, sep="\t", na_values="\\N", nrows=nrows)
+        # 텍스트 모드 래퍼 없이 pandas C 파서가 gzip 바이트를 직접 디코딩
+        df = pd.read_csv(
+            filepath,
+            sep="\t",
+            na_values="\\N",
+            nrows=nrows,
+            compression="gzip",
+            encoding="utf-8",
+        )
 
         logger.info(f"로드 완료: {dataset_name} - {len(df):,} 행")
         return df
@@ -86,13 +100,17 @@ class IMDbDataLoader:
         """
         logger.info("🎬 영화 평점 예측 데이터셋 생성 시작...")
 
-        # 1. 기본 영화 정보 로드 (샘플링으로 빠른 처리)
-        logger.info("📁 title.basics 로드 중...")
-        title_basics = self.load_imdb_tsv("title_basics", nrows=sample_size)
+        # 1~2. 기본 영화 정보(샘플링) + 평점 정보 병렬 로드
+        # 두 파일은 서로 독립적이므로 다운로드/압축 해제/파싱 I/O를 겹쳐서 처리
+        logger.info("📁 title.basics / ⭐ title.ratings 병렬 로드 중...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            basics_future = executor.submit(
+                self.load_imdb_tsv, "title_basics", nrows=sample_size
+            )
+            ratings_future = executor.submit(self.load_imdb_tsv, "title_ratings")
 
-        # 2. 평점 정보 로드
-        logger.info("⭐ title.ratings 로드 중...")
-        title_ratings = self.load_imdb_tsv("title_ratings")
+            title_basics = basics_future.result()
+            title_ratings = ratings_future.result()
 
         # 3. 영화만 필터링 (TV 시리즈 제외)
         logger.info("🎭 영화 데이터 필터링 중...")
@@ -107,9 +125,6 @@ class IMDbDataLoader:
         # 5. 데이터 품질 향상을 위한 필터링
         logger.info("🧹 데이터 정제 중...")
 
-        # 필수 컬럼 결측값 제거
-        movie_ratings = movie_ratings.dropna(subset=["averageRating", "numVotes"])
-
         # 연도 데이터 타입 변환 (결측값 허용)
         movie_ratings["startYear"] = pd.to_numeric(
             movie_ratings["startYear"], errors="coerce"
@@ -117,12 +132,15 @@ class IMDbDataLoader:
 
         # 더 관대한 필터링
         min_votes = 50  # 최소 50표로 낮춤
-        movie_ratings = movie_ratings[movie_ratings["numVotes"] >= min_votes]
 
-        # 연도 필터링을 더 관대하게 (1900년 이후)
-        movie_ratings = movie_ratings[
-            (movie_ratings["startYear"].isna()) | (movie_ratings["startYear"] >= 1900)
-        ]
+        # 필수 컬럼 결측값 제거 + 투표수 + 연도(1900년 이후) 조건을 하나의 마스크로 결합
+        # (단계별 필터링마다 생기는 중간 DataFrame 복사 제거)
+        keep_mask = (
+            movie_ratings["averageRating"].notna()
+            & (movie_ratings["numVotes"] >= min_votes)
+            & (movie_ratings["startYear"].isna() | (movie_ratings["startYear"] >= 1900))
+        )
+        movie_ratings = movie_ratings[keep_mask]
 
         # 디버깅 정보 추가
         logger.info(f"필터링 단계별 개수:")
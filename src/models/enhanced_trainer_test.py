@@ -3,7 +3,9 @@ icecream, tqdm, rich 통합이 포함된 향상된 트레이너
 더 나은 디버깅, 진행률 추적, 시각적 피드백
 """
 
+import json
 import logging
+import sys
 import warnings
 from datetime import datetime
 from pathlib import Path
@@ -18,16 +20,17 @@ from sklearn.ensemble import RandomForestRegressor
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
-
-warnings.filterwarnings("ignore")
+from sklearn.preprocessing import StandardScaler
 
 # 향상된 유틸리티
 from ..utils.enhanced import (
+    HAS_FIRE,
     HAS_ICECREAM,
     HAS_RICH,
     HAS_TQDM,
     EnhancedLogger,
     ProgressTracker,
+    demo_enhanced_features,
     display_table,
     enhanced_print,
     ic,
@@ -57,6 +60,10 @@ class EnhancedMovieRatingTrainer:
         self.logger = EnhancedLogger("향상된트레이너")
         self.progress = ProgressTracker()
 
+        # 비용이 큰 디버그 출력(describe(), 통계)은 DEBUG 레벨에서만 수행
+        # (HAS_ICECREAM은 기능 사용 가능 여부 확인용으로만 사용)
+        self.debug = self.logger.logger.isEnabledFor(logging.DEBUG)
+
         # 향상된 로깅과 함께 MLflow 설정
         try:
             mlflow.set_experiment(self.experiment_name)
@@ -66,9 +73,11 @@ class EnhancedMovieRatingTrainer:
             ic(e)
 
     def load_data(
-        self, data_path: str = "data/processed/movies_with_ratings.csv"
+        self,
+        data_path: str = "data/processed/movies_with_ratings.csv",
+        only_features: bool = True,
     ) -> pd.DataFrame:
-        """향상된 진행률 추적으로 데이터 로드"""
+        """향상된 진행률 추적으로 데이터 로드 (기본: 훈련에 필요한 컬럼만)"""
         self.logger.info("영화 데이터 로딩 중...")
         ic(data_path)
 
@@ -76,11 +85,8 @@ class EnhancedMovieRatingTrainer:
             self.logger.error(f"데이터 파일을 찾을 수 없습니다: {data_path}")
             raise FileNotFoundError(f"데이터 파일을 찾을 수 없습니다: {data_path}")
 
-        # 진행률 표시와 함께 로드
-        with self.progress.progress_context("데이터 로딩") as progress:
-            task = progress.add_task("CSV 읽는 중...", total=100)
-            df = pd.read_csv(data_path)
-            progress.update(task, advance=100)
+        # 단일 블로킹 호출이므로 진행률 표시 없이 바로 로드 (실제 진행률을 알 수 없음)
+        df = pd.read_csv(data_path, **self._read_csv_options(only_features))
 
         self.logger.success(f"데이터 로드 완료: {len(df):,}개 영화")
         ic(df.shape, df.columns.tolist())
@@ -93,7 +99,7 @@ class EnhancedMovieRatingTrainer:
                 ["총 영화 수", f"{len(df):,}"],
                 ["컬럼 수", str(len(df.columns))],
                 ["메모리 사용량", f"{df.memory_usage().sum() / 1024**2:.1f} MB"],
-                ["결측값", str(df.isnull().sum().sum())],
+                ["결측값", str(df.size - df.count().sum())],
                 ["평균 평점", f"{df[self.TARGET_COLUMN].mean():.2f}"],
                 [
                     "평점 범위",
@@ -104,6 +110,18 @@ class EnhancedMovieRatingTrainer:
 
         return df
 
+    def _read_csv_options(self, only_features: bool) -> Dict[str, Any]:
+        """훈련에 필요한 컬럼만 파싱하도록 하는 read_csv 인자"""
+        if not only_features:
+            return {}
+
+        required_columns = set(self.BASE_FEATURES + [self.TARGET_COLUMN])
+        return {
+            "usecols": lambda col: col in required_columns,
+            "dtype": {feature: np.float32 for feature in self.BASE_FEATURES},
+            "engine": "c",
+        }
+
     def prepare_features(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """디버깅이 포함된 향상된 피처 준비"""
         self.logger.info("피처 준비 중...")
@@ -129,24 +147,22 @@ class EnhancedMovieRatingTrainer:
         X = df[available_features].copy()
 
         # 피처 통계의 향상된 디버깅
-        if HAS_ICECREAM:
+        if HAS_ICECREAM and self.debug:
             for feature in available_features:
                 ic(feature)
                 ic(X[feature].describe())
                 ic(X[feature].isnull().sum())
 
-        # 진행률 추적과 함께 결측값 채우기
-        with self.progress.progress_context("결측값 채우기") as progress:
-            task = progress.add_task("처리 중...", total=len(available_features))
-            for feature in available_features:
-                median_val = X[feature].median()
-                X[feature] = X[feature].fillna(median_val)
-                progress.update(task, advance=1)
-                ic(f"{feature}의 결측값을 {median_val}로 채움")
+        # 결측값 채우기 (중앙값을 한 번에 계산한 뒤 단일 fillna로 처리)
+        medians = X.median().to_dict()
+        X = X.fillna(medians)
+        if self.debug:
+            ic("결측값을 중앙값으로 채움", medians)
 
         # 타겟 변수
         y = df[self.TARGET_COLUMN].values
-        ic(y.shape, y.min(), y.max(), y.mean())
+        if self.debug:
+            ic(y.shape, y.min(), y.max(), y.mean())
 
         # 피처 이름 저장
         self.feature_names = available_features
@@ -157,14 +173,33 @@ class EnhancedMovieRatingTrainer:
 
         # 피처 상관관계 분석 (향상된 출력)
         if HAS_RICH:
-            correlations = []
-            for feature in available_features:
-                corr = np.corrcoef(X[feature], y)[0, 1]
-                correlations.append([feature, f"{corr:.3f}"])
+            # 피처별 2x2 corrcoef 반복 대신 [피처 | 타겟] 전체 상관행렬을 한 번 계산
+            # (마지막 열이 피처-타겟 상관계수)
+            corr_matrix = np.corrcoef(np.column_stack([X.values, y]), rowvar=False)
+            correlations = [
+                [feature, f"{corr:.3f}"]
+                for feature, corr in zip(available_features, corr_matrix[:-1, -1])
+            ]
 
             display_table("피처-타겟 상관관계", ["피처", "상관관계"], correlations)
 
-        return X.values, y
+        # float32 피처로 스케일링/훈련/예측 시 메모리 이동량 절반
+        # (RandomForest는 내부적으로 어차피 X를 float32로 변환)
+        return X.to_numpy(dtype=np.float32), y
+
+    def _fit_forest_in_steps(
+        self, X_train: np.ndarray, y_train: np.ndarray, step: int = 10
+    ) -> None:
+        """warm_start로 step개씩 트리를 추가하며 self.model을 n_estimators까지 훈련"""
+        # 단일 트리 모델을 이어 붙이는 대신 단계마다 한 번의 병렬 fit 수행
+        # 마지막 단계는 항상 설정된 전체 개수로 맞춤
+        total_estimators = self.model.n_estimators
+        steps = list(range(step, total_estimators, step)) + [total_estimators]
+        self.model.set_params(warm_start=True)
+        for n_estimators in self.progress.track(steps, "추정기 훈련"):
+            self.model.set_params(n_estimators=n_estimators)
+            self.model.fit(X_train, y_train)
+        self.model.set_params(warm_start=False)
 
     def train_model(
         self, X: np.ndarray, y: np.ndarray, model_type: str = "random_forest"
@@ -184,7 +219,6 @@ class EnhancedMovieRatingTrainer:
         # 진행률과 함께 피처 스케일링
 
         self.logger.info("피처 스케일링 중...")
-        from sklearn.preprocessing import StandardScaler
 
         self.scaler = StandardScaler()
 
@@ -216,18 +250,7 @@ class EnhancedMovieRatingTrainer:
 
         # RandomForest의 경우 n_estimators를 사용하여 진행률 추적 가능
         if model_type == "random_forest" and HAS_TQDM:
-            # RandomForest용 사용자 정의 진행률 추적
-            estimators_list = []
-            for i in self.progress.track(range(100), "추정기 훈련"):
-                temp_model = RandomForestRegressor(
-                    n_estimators=1, random_state=42 + i, warm_start=False
-                )
-                temp_model.fit(X_train_scaled, y_train)
-                estimators_list.extend(temp_model.estimators_)
-
-            # 모든 추정기 결합
-            self.model.estimators_ = estimators_list
-            self.model.n_estimators = len(estimators_list)
+            self._fit_forest_in_steps(X_train_scaled, y_train)
         else:
             self.model.fit(X_train_scaled, y_train)
 
@@ -272,27 +295,31 @@ class EnhancedMovieRatingTrainer:
         # 향상된 오류 처리와 함께 MLflow 로깅
         try:
             with mlflow.start_run():
-                # 매개변수
-                mlflow.log_param("model_type", model_type)
-                mlflow.log_param("features", self.feature_names)
-                mlflow.log_param("n_features", len(self.feature_names))
-                mlflow.log_param("training_time", training_time)
-
-                # 메트릭
-                for metric_name, metric_value in metrics.items():
-                    mlflow.log_metric(metric_name, metric_value)
+                # 매개변수와 메트릭 (각각 한 번의 배치 호출)
+                mlflow.log_params(
+                    {
+                        "model_type": model_type,
+                        "features": self.feature_names,
+                        "n_features": len(self.feature_names),
+                        "training_time": training_time,
+                    }
+                )
+                mlflow.log_metrics(metrics)
 
                 # 모델 로깅
                 input_example = pd.DataFrame(
                     X_train_scaled[:5], columns=self.feature_names
                 )
 
-                mlflow.sklearn.log_model(
-                    self.model,
-                    "model",
-                    input_example=input_example,
-                    registered_model_name=f"{model_type}_movie_rating_enhanced",
-                )
+                # 모델 로깅 중 발생하는 경고(서명 추론 등)만 국소적으로 무시
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    mlflow.sklearn.log_model(
+                        self.model,
+                        "model",
+                        input_example=input_example,
+                        registered_model_name=f"{model_type}_movie_rating_enhanced",
+                    )
 
                 self.logger.success("MLflow 로깅 완료")
 
@@ -327,29 +354,26 @@ class EnhancedMovieRatingTrainer:
             "version": "2.0",
         }
 
-        # 진행률 추적과 함께 저장
-        with self.progress.progress_context("모델 저장") as progress:
-            task = progress.add_task("파일 저장 중...", total=100)
+        # 각 dump는 단일 블로킹 호출이므로 진행률 표시 없이 저장
+        # compress=3 (zlib) - 약간의 CPU 비용으로 포레스트 아티팩트 크기 감소
+        joblib.dump(model_info, model_path, compress=3)
+        ic(f"모델 저장됨: {model_path}")
 
-            joblib.dump(model_info, model_path)
-            progress.update(task, advance=50)
-            ic(f"모델 저장됨: {model_path}")
-
-            if self.scaler:
-                joblib.dump(self.scaler, scaler_path)
-            progress.update(task, advance=50)
+        if self.scaler:
+            joblib.dump(self.scaler, scaler_path, compress=3)
             ic(f"스케일러 저장됨: {scaler_path}")
 
         self.logger.success(f"모델이 성공적으로 저장되었습니다!")
 
-        # 검증 확인
-        try:
-            test_load = joblib.load(model_path)
-            self.logger.success("모델 파일 검증 통과")
-            ic("모델 저장 검증 성공")
-        except Exception as e:
-            self.logger.error(f"모델 파일 검증 실패: {e}")
-            ic(e)
+        # 재로드 검증은 I/O와 최대 메모리를 두 배로 늘리므로 디버그 실행에서만 수행
+        if self.debug:
+            try:
+                joblib.load(model_path)
+                self.logger.success("모델 파일 검증 통과")
+                ic("모델 저장 검증 성공")
+            except Exception as e:
+                self.logger.error(f"모델 파일 검증 실패: {e}")
+                ic(e)
 
         return {
             "model_path": str(model_path),
@@ -420,7 +444,10 @@ def enhanced_model_comparison(
     models_to_compare = ["random_forest", "linear_regression"]
     comparison_results = []
 
-    for model_type in logger.progress.track(models_to_compare, "모델 비교"):
+    # 데이터 로드/피처 준비는 모델과 무관하므로 첫 성공 시 한 번만 수행하고 재사용
+    X = y = feature_names = None
+
+    for model_type in ProgressTracker().track(models_to_compare, "모델 비교"):
         try:
             logger.info(f"{model_type} 모델 훈련 중...")
 
@@ -429,8 +456,13 @@ def enhanced_model_comparison(
                 experiment_name=f"model_comparison_{model_type}"
             )
 
-            df = trainer.load_data(data_path)
-            X, y = trainer.prepare_features(df)
+            if X is None:
+                df = trainer.load_data(data_path)
+                X, y = trainer.prepare_features(df)
+                feature_names = trainer.feature_names
+            else:
+                trainer.feature_names = feature_names
+
             metrics = trainer.train_model(X, y, model_type=model_type)
 
             # 결과 저장
@@ -484,6 +516,15 @@ def enhanced_hyperparameter_tuning(
     df = trainer.load_data(data_path)
     X, y = trainer.prepare_features(df)
 
+    # 분할/스케일링은 모든 매개변수 조합에서 동일하므로 루프 밖에서 한 번만 수행
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
     for i, params in enumerate(
         trainer.progress.track(param_combinations, "하이퍼파라미터 테스트")
     ):
@@ -491,20 +532,8 @@ def enhanced_hyperparameter_tuning(
             logger.info(f"매개변수 조합 {i+1}/{len(param_combinations)} 테스트 중...")
             ic(params)
 
-            # 사용자 정의 모델로 훈련
-            from sklearn.model_selection import train_test_split
-            from sklearn.preprocessing import StandardScaler
-
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
-
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
-
             # 매개변수로 모델 생성
-            model = RandomForestRegressor(random_state=42, **params)
+            model = RandomForestRegressor(random_state=42, n_jobs=-1, **params)
             model.fit(X_train_scaled, y_train)
 
             # 평가
@@ -556,6 +585,8 @@ def enhanced_hyperparameter_tuning(
         # 최적 매개변수로 최종 모델 훈련
         logger.info("최적 매개변수로 최종 모델 훈련 중...")
         final_trainer = EnhancedMovieRatingTrainer(experiment_name="best_model_final")
+        # X는 위에서 준비한 피처 그대로 사용
+        final_trainer.feature_names = trainer.feature_names
 
         # 최적 매개변수를 사용하여 모델 재정의
         final_trainer.model = RandomForestRegressor(random_state=42, **best_params)
@@ -591,19 +622,21 @@ def enhanced_data_analysis(data_path: str = "data/processed/movies_with_ratings.
         # 기본 통계
         numeric_columns = df.select_dtypes(include=[np.number]).columns
 
-        # 기본 통계 테이블
-        basic_stats = []
-        for col in numeric_columns:
-            basic_stats.append(
-                [
-                    col,
-                    f"{df[col].mean():.2f}",
-                    f"{df[col].std():.2f}",
-                    f"{df[col].min():.2f}",
-                    f"{df[col].max():.2f}",
-                    str(df[col].isnull().sum()),
-                ]
-            )
+        # 기본 통계 테이블 (컬럼별 개별 호출 대신 한 번의 agg로 계산)
+        summary = df[numeric_columns].agg(["mean", "std", "min", "max"])
+        missing = len(df) - df[numeric_columns].count()
+
+        basic_stats = [
+            [
+                col,
+                f"{summary.at['mean', col]:.2f}",
+                f"{summary.at['std', col]:.2f}",
+                f"{summary.at['min', col]:.2f}",
+                f"{summary.at['max', col]:.2f}",
+                str(missing[col]),
+            ]
+            for col in numeric_columns
+        ]
 
         display_table(
             "기본 통계",
@@ -631,9 +664,13 @@ def enhanced_data_analysis(data_path: str = "data/processed/movies_with_ratings.
                 df[rating_col], bins=bins, labels=labels, include_lowest=True
             )
 
+            # 구간별 개수를 한 번에 집계하고, 비율은 그 개수에서 바로 계산
+            category_counts = df["rating_category"].value_counts(sort=False)
+            total_count = len(df)
+
             for category in labels:
-                count = (df["rating_category"] == category).sum()
-                percentage = (count / len(df)) * 100
+                count = category_counts[category]
+                percentage = (count / total_count) * 100
                 rating_stats.append([category, str(count), f"{percentage:.1f}%"])
 
             display_table("평점 분포", ["평점 구간", "영화 수", "비율"], rating_stats)
@@ -647,26 +684,32 @@ def enhanced_data_analysis(data_path: str = "data/processed/movies_with_ratings.
             if len(recent_years) > 0:
                 year_analysis = []
 
-                # 5년 단위로 그룹화
-                year_groups = [
-                    (2000, 2004, "2000-2004"),
-                    (2005, 2009, "2005-2009"),
-                    (2010, 2014, "2010-2014"),
-                    (2015, 2019, "2015-2019"),
-                    (2020, 2024, "2020-2024"),
+                # 5년 단위로 그룹화 (구간별 필터링 대신 pd.cut + groupby 한 번)
+                year_bins = [2000, 2005, 2010, 2015, 2020, 2025]
+                year_labels = [
+                    "2000-2004",
+                    "2005-2009",
+                    "2010-2014",
+                    "2015-2019",
+                    "2020-2024",
                 ]
 
-                for start_year, end_year, label in year_groups:
-                    group_data = recent_years[
-                        (recent_years[year_col] >= start_year)
-                        & (recent_years[year_col] <= end_year)
-                    ]
+                year_group = pd.cut(
+                    recent_years[year_col],
+                    bins=year_bins,
+                    labels=year_labels,
+                    right=False,
+                )
+                year_summary = (
+                    recent_years[rating_col]
+                    .groupby(year_group, observed=False)
+                    .agg(["size", "mean"])
+                )
 
-                    if len(group_data) > 0:
-                        avg_rating = group_data[rating_col].mean()
-                        movie_count = len(group_data)
+                for label, (movie_count, avg_rating) in year_summary.iterrows():
+                    if movie_count > 0:
                         year_analysis.append(
-                            [label, str(movie_count), f"{avg_rating:.2f}"]
+                            [label, str(int(movie_count)), f"{avg_rating:.2f}"]
                         )
 
                 display_table(
@@ -679,14 +722,24 @@ def enhanced_data_analysis(data_path: str = "data/processed/movies_with_ratings.
         genre_columns = [col for col in df.columns if col.startswith("genre_")]
         if genre_columns:
             genre_analysis = []
-
-            for genre_col in genre_columns[:10]:  # 상위 10개 장르만
-                genre_name = genre_col.replace("genre_", "").title()
-                genre_movies = df[df[genre_col] == 1]
-
-                if len(genre_movies) > 0:
-                    avg_rating = genre_movies[rating_col].mean()
-                    movie_count = len(genre_movies)
+            top_genre_columns = genre_columns[:10]  # 상위 10개 장르만
+
+            # 장르별 필터링 반복 대신 (행 x 장르) 마스크 행렬로 개수/평균을 한 번에 계산
+            genre_mask = df[top_genre_columns].eq(1).to_numpy()
+            ratings = df[rating_col].to_numpy(dtype=np.float64)
+            rated = ~np.isnan(ratings)
+
+            movie_counts = genre_mask.sum(axis=0)
+            rated_counts = (genre_mask & rated[:, None]).sum(axis=0)
+            rating_sums = np.where(rated, ratings, 0.0) @ genre_mask
+            with np.errstate(invalid="ignore", divide="ignore"):
+                avg_ratings = rating_sums / rated_counts
+
+            for genre_col, movie_count, avg_rating in zip(
+                top_genre_columns, movie_counts, avg_ratings
+            ):
+                if movie_count > 0:
+                    genre_name = genre_col.replace("genre_", "").title()
                     genre_analysis.append(
                         [genre_name, str(movie_count), f"{avg_rating:.2f}"]
                     )
@@ -702,14 +755,16 @@ def enhanced_data_analysis(data_path: str = "data/processed/movies_with_ratings.
 
         # 상관관계 분석
         if len(numeric_columns) > 1:
-            correlation_data = []
             target_col = rating_col
 
-            for col in numeric_columns:
-                if col != target_col and col in df.columns:
-                    corr = df[col].corr(df[target_col])
-                    if not np.isnan(corr):
-                        correlation_data.append([col, f"{corr:.3f}"])
+            # 컬럼별 corr 반복 대신 corrwith 한 번으로 타깃과의 상관계수 계산
+            feature_columns = [col for col in numeric_columns if col != target_col]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                correlations = df[feature_columns].corrwith(df[target_col]).dropna()
+
+            correlation_data = [
+                [col, f"{corr:.3f}"] for col, corr in correlations.items()
+            ]
 
             # 상관관계 절댓값으로 정렬
             correlation_data.sort(key=lambda x: abs(float(x[1])), reverse=True)
@@ -1003,9 +1058,13 @@ def enhanced_batch_predict(csv_path: str, output_path: str = None):
             logger.error(f"필수 컬럼 누락: {missing_cols}")
             return None
 
-        # 모델 로드
+        # 모델 로드 (같은 패턴으로 저장되는 스케일러 파일은 제외)
         models_dir = Path("models")
-        model_files = list(models_dir.glob("enhanced_*.joblib"))
+        model_files = [
+            file_path
+            for file_path in models_dir.glob("enhanced_*.joblib")
+            if not file_path.name.startswith("enhanced_scaler_")
+        ]
 
         if not model_files:
             logger.error("저장된 모델을 찾을 수 없습니다")
@@ -1025,44 +1084,43 @@ def enhanced_batch_predict(csv_path: str, output_path: str = None):
 
         logger.info(f"모델 로드 완료: {type(model).__name__}")
 
-        # 스케일러 로드 (있는 경우)
+        # 스케일러 로드 (있는 경우) - 모델과 같은 타임스탬프로 저장된 파일
         scaler = None
-        scaler_path = (
-            str(model_path)
-            .replace("enhanced_randomforest", "enhanced_scaler")
-            .replace("enhanced_linear", "enhanced_scaler")
-        )
-        if Path(scaler_path).exists():
+        timestamp = "_".join(model_path.stem.split("_")[-2:])
+        scaler_path = models_dir / f"enhanced_scaler_{timestamp}.joblib"
+        if scaler_path.exists():
             scaler = joblib.load(scaler_path)
             logger.info("스케일러 로드 완료")
 
-        # 배치 예측
-        predictions = []
+        # 배치 예측 - 피처 행렬을 한 번에 만들어 단일 predict 호출로 처리
+        # (없는 피처 컬럼은 0으로 채움)
+        X = df.reindex(columns=feature_names, fill_value=0).to_numpy()
 
-        for idx, row in self.progress.track(df.iterrows(), "예측 중", total=len(df)):
-            try:
-                # 피처 벡터 생성
-                feature_vector = []
-                for feature in feature_names:
-                    if feature in row:
-                        feature_vector.append(row[feature])
-                    else:
-                        feature_vector.append(0)
+        try:
+            X_input = scaler.transform(X) if scaler else X
+            predictions = np.clip(model.predict(X_input), 1.0, 10.0)
+        except Exception as e:
+            # 일부 행 때문에 일괄 예측이 실패하면 행 단위로 재시도해서 실패한 행만 NaN 처리
+            logger.warning(f"일괄 예측 실패, 행 단위로 재시도합니다: {e}")
+            predictions = []
 
-                feature_vector = np.array(feature_vector).reshape(1, -1)
+            for idx, feature_vector in ProgressTracker().track(
+                zip(df.index, X), "예측 중", total=len(df)
+            ):
+                try:
+                    feature_vector = feature_vector.reshape(1, -1)
 
-                # 스케일링 적용
-                if scaler:
-                    feature_vector = scaler.transform(feature_vector)
+                    # 스케일링 적용
+                    if scaler:
+                        feature_vector = scaler.transform(feature_vector)
 
-                # 예측
-                prediction = model.predict(feature_vector)[0]
-                prediction = max(1.0, min(10.0, prediction))
-                predictions.append(prediction)
+                    # 예측
+                    prediction = model.predict(feature_vector)[0]
+                    predictions.append(max(1.0, min(10.0, prediction)))
 
-            except Exception as e:
-                logger.warning(f"행 {idx} 예측 실패: {e}")
-                predictions.append(np.nan)
+                except Exception as row_error:
+                    logger.warning(f"행 {idx} 예측 실패: {row_error}")
+                    predictions.append(np.nan)
 
         # 결과 추가
         df["predicted_rating"] = predictions
@@ -1118,7 +1176,6 @@ ENHANCED_CLI_FUNCTIONS = {
     "model_info": enhanced_model_info,
     # 유틸리티
     "demo": demo_enhanced_features,
-    "help": show_enhanced_help,
 }
 
 
@@ -1258,15 +1315,19 @@ def enhanced_cleanup():
             logger.info("models 디렉토리가 없습니다")
             return
 
-        # 모든 모델 파일 찾기
-        model_files = list(models_dir.glob("*.joblib")) + list(models_dir.glob("*.pkl"))
+        # 모든 모델 파일 찾기 (stat은 파일당 한 번만 수행해서 재사용)
+        model_files = [
+            (file_path, file_path.stat())
+            for pattern in ("*.joblib", "*.pkl")
+            for file_path in models_dir.glob(pattern)
+        ]
 
         if not model_files:
             logger.info("정리할 모델 파일이 없습니다")
             return
 
         # 파일을 수정 시간순으로 정렬
-        model_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        model_files.sort(key=lambda item: item[1].st_mtime, reverse=True)
 
         # 최신 5개 파일 유지, 나머지 삭제
         keep_count = 5
@@ -1276,41 +1337,42 @@ def enhanced_cleanup():
             logger.info(f"모든 파일이 최신입니다 ({len(model_files)}개 파일)")
             return
 
-        # 삭제할 파일 목록 표시
-        delete_info = []
-        total_size = 0
-
-        for file_path in files_to_delete:
-            size = file_path.stat().st_size
-            total_size += size
-            modified = datetime.fromtimestamp(file_path.stat().st_mtime)
-            delete_info.append(
+        def file_info_rows(files):
+            return [
                 [
                     file_path.name,
-                    f"{size / 1024**2:.1f} MB",
-                    modified.strftime("%Y-%m-%d %H:%M"),
+                    f"{file_stat.st_size / 1024**2:.1f} MB",
+                    datetime.fromtimestamp(file_stat.st_mtime).strftime(
+                        "%Y-%m-%d %H:%M"
+                    ),
                 ]
-            )
+                for file_path, file_stat in files
+            ]
+
+        # 삭제할 파일 목록 표시
+        total_size = sum(file_stat.st_size for _, file_stat in files_to_delete)
 
         display_table(
             f"삭제할 파일 ({len(files_to_delete)}개)",
             ["파일명", "크기", "수정일"],
-            delete_info,
+            file_info_rows(files_to_delete),
         )
 
         # 사용자 확인 (CLI에서)
         enhanced_print(f"\n총 {total_size / 1024**2:.1f} MB를 절약할 수 있습니다.")
 
-        # 파일 삭제
-        deleted_count = 0
-        for file_path in self.progress.track(files_to_delete, "파일 삭제"):
+        # 파일 삭제 (한 번의 패스로 일괄 삭제, 실패한 파일만 개별 보고)
+        failed = []
+        for file_path, _ in files_to_delete:
             try:
-                file_path.unlink()
-                deleted_count += 1
-                ic(f"삭제됨: {file_path.name}")
-            except Exception as e:
-                logger.warning(f"삭제 실패: {file_path.name} - {e}")
+                file_path.unlink(missing_ok=True)
+            except OSError as e:
+                failed.append(f"{file_path.name} - {e}")
+
+        for failure in failed:
+            logger.warning(f"삭제 실패: {failure}")
 
+        deleted_count = len(files_to_delete) - len(failed)
         logger.success(
             f"{deleted_count}개 파일 삭제 완료 ({total_size / 1024**2:.1f} MB 절약)"
         )
@@ -1318,22 +1380,10 @@ def enhanced_cleanup():
         # 남은 파일 표시
         remaining_files = model_files[:keep_count]
         if remaining_files:
-            remaining_info = []
-            for file_path in remaining_files:
-                size = file_path.stat().st_size
-                modified = datetime.fromtimestamp(file_path.stat().st_mtime)
-                remaining_info.append(
-                    [
-                        file_path.name,
-                        f"{size / 1024**2:.1f} MB",
-                        modified.strftime("%Y-%m-%d %H:%M"),
-                    ]
-                )
-
             display_table(
                 f"유지된 파일 ({len(remaining_files)}개)",
                 ["파일명", "크기", "수정일"],
-                remaining_info,
+                file_info_rows(remaining_files),
             )
 
     except Exception as e:
@@ -1350,9 +1400,21 @@ def enhanced_export_results(output_dir: str = "results"):
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
 
-        # 모델 정보 수집
+        # 파일 쓰기 후 stat() 재호출 대신 실제로 쓴 바이트 수를 기록
+        written_sizes = {}
+
+        def write_text(path: Path, text: str):
+            data = text.encode("utf-8")
+            path.write_bytes(data)
+            written_sizes[path.name] = len(data)
+
+        # 모델 정보 수집 (같은 패턴으로 저장되는 스케일러 파일은 제외)
         models_dir = Path("models")
-        model_files = list(models_dir.glob("enhanced_*.joblib"))
+        model_files = [
+            file_path
+            for file_path in models_dir.glob("enhanced_*.joblib")
+            if not file_path.name.startswith("enhanced_scaler_")
+        ]
 
         if not model_files:
             logger.warning("내보낼 모델이 없습니다")
@@ -1362,7 +1424,8 @@ def enhanced_export_results(output_dir: str = "results"):
         latest_model = max(model_files, key=lambda x: x.stat().st_mtime)
         model_data = joblib.load(latest_model)
 
-        # 모델 정보를 JSON으로 내보내기
+        # 모델 정보를 JSON으로 내보내기 (이전 형식 모델은 상세 정보 없음)
+        export_data = {}
         if isinstance(model_data, dict):
             export_data = {
                 "model_type": model_data.get("model_type", "Unknown"),
@@ -1377,11 +1440,11 @@ def enhanced_export_results(output_dir: str = "results"):
                 export_data["model_params"] = model_data["model"].get_params()
 
             # JSON 파일로 저장
-            import json
-
             json_path = output_path / "model_info.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            write_text(
+                json_path,
+                json.dumps(export_data, indent=2, ensure_ascii=False, default=str),
+            )
 
             logger.success(f"모델 정보 저장: {json_path}")
 
@@ -1400,8 +1463,7 @@ def enhanced_export_results(output_dir: str = "results"):
         }
 
         summary_path = output_path / "execution_summary.json"
-        with open(summary_path, "w", encoding="utf-8") as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        write_text(summary_path, json.dumps(summary_data, indent=2, ensure_ascii=False))
 
         logger.success(f"실행 요약 저장: {summary_path}")
 
@@ -1434,27 +1496,23 @@ def enhanced_export_results(output_dir: str = "results"):
     """
 
         readme_path = output_path / "README.md"
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        write_text(readme_path, readme_content)
 
         logger.success(f"README 생성: {readme_path}")
 
-        # 결과 요약 표시
+        # 결과 요약 표시 (실제로 쓴 파일만)
+        file_descriptions = {
+            "model_info.json": "모델 상세 정보",
+            "execution_summary.json": "실행 환경 요약",
+            "README.md": "사용법 안내",
+        }
         display_table(
             "내보내기 결과",
             ["파일", "설명", "크기"],
             [
-                [
-                    "model_info.json",
-                    "모델 상세 정보",
-                    f"{json_path.stat().st_size} bytes",
-                ],
-                [
-                    "execution_summary.json",
-                    "실행 환경 요약",
-                    f"{summary_path.stat().st_size} bytes",
-                ],
-                ["README.md", "사용법 안내", f"{readme_path.stat().st_size} bytes"],
+                [name, description, f"{written_sizes[name]} bytes"]
+                for name, description in file_descriptions.items()
+                if name in written_sizes
             ],
         )
 
@@ -1473,6 +1531,7 @@ ENHANCED_CLI_FUNCTIONS.update(
         "system_check": enhanced_system_check,
         "cleanup": enhanced_cleanup,
         "export": enhanced_export_results,
+        "help": show_enhanced_help,
     }
 )
 
@@ -1486,6 +1545,8 @@ def main():
         # 시스템 체크 실행
         enhanced_system_check()
 
+        import fire
+
         fire.Fire(ENHANCED_CLI_FUNCTIONS)
     else:
         print("❌ Fire를 사용할 수 없습니다. 향상된 의존성을 설치하세요:")
@@ -8,8 +8,6 @@ import numpy as np
 import pandas as pd
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
-warnings.filterwarnings("ignore")
-
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -20,6 +18,13 @@ class ModelEvaluator:
     trainer.py와 동일한 피처 정의 사용
     """
 
+    # 입력에 피처가 없을 때 사용할 기본값 (그 외 피처는 0)
+    DEFAULT_FEATURE_VALUES = {
+        "startYear": 2000,  # 기본 연도
+        "runtimeMinutes": 120,  # 기본 러닝타임
+        "numVotes": 1000,  # 기본 투표수
+    }
+
     def __init__(self):
         self.model = None
         self.scaler = None
@@ -31,7 +36,7 @@ class ModelEvaluator:
         """모델과 관련 정보 로드"""
         try:
             # 모델 정보 로드 (feature_names 포함)
-            self.model_info = joblib.load(model_path)
+            self.model_info = self._load_artifact(model_path)
 
             # 새로운 형식 (딕셔너리)인지 확인
             if isinstance(self.model_info, dict):
@@ -55,7 +60,7 @@ class ModelEvaluator:
             scaler_path = model_path_obj.parent / f"scaler_{timestamp}.joblib"
 
             if scaler_path.exists():
-                self.scaler = joblib.load(scaler_path)
+                self.scaler = self._load_artifact(scaler_path)
                 logger.info(f"스케일러 로드 완료: {scaler_path}")
             else:
                 logger.warning(f"스케일러 파일을 찾을 수 없습니다: {scaler_path}")
@@ -69,6 +74,13 @@ class ModelEvaluator:
             logger.error(f"모델 로드 실패: {e}")
             raise
 
+    @staticmethod
+    def _load_artifact(path) -> Any:
+        """joblib 아티팩트 로드 (sklearn 버전 불일치 등 로드 시 경고만 국소적으로 무시)"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return joblib.load(path)
+
     def evaluate_model(
         self, X: np.ndarray, y: np.ndarray
     ) -> Tuple[Dict[str, float], np.ndarray]:
@@ -114,15 +126,10 @@ class ModelEvaluator:
                 if feature_name in movie_data:
                     feature_values.append(movie_data[feature_name])
                 else:
-                    # 기본값 설정
-                    if feature_name == "startYear":
-                        feature_values.append(2000)  # 기본 연도
-                    elif feature_name == "runtimeMinutes":
-                        feature_values.append(120)  # 기본 러닝타임
-                    elif feature_name == "numVotes":
-                        feature_values.append(1000)  # 기본 투표수
-                    else:
-                        feature_values.append(0)  # 기타 기본값
+                    # 기본값 설정 (단일 dict 조회)
+                    feature_values.append(
+                        self.DEFAULT_FEATURE_VALUES.get(feature_name, 0)
+                    )
 
                     logger.warning(f"피처 '{feature_name}'가 없어 기본값 사용")
 
@@ -165,7 +172,10 @@ class ModelEvaluator:
                 f"필요한 피처가 없습니다. 필요: {self.feature_names}, 사용가능: {list(movies_df.columns)}"
             )
 
-        X = movies_df[available_features].fillna(movies_df[available_features].median())
+        # 피처 슬라이스와 중앙값 통계를 한 번만 계산한 뒤 dict로 채움
+        X = movies_df[available_features]
+        medians = X.median().to_dict()
+        X = X.fillna(medians)
 
         # 스케일링 적용
         if self.scaler is not None:
@@ -15,8 +15,6 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
-warnings.filterwarnings("ignore")
-
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -102,7 +100,9 @@ class MovieRatingTrainer:
 
         # 모델 선택
         if model_type == "random_forest":
-            self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+            self.model = RandomForestRegressor(
+                n_estimators=100, random_state=42, n_jobs=-1  # 모든 CPU 코어 사용
+            )
         elif model_type == "linear_regression":
             self.model = LinearRegression()
         else:
@@ -125,26 +125,30 @@ class MovieRatingTrainer:
 
             # MLflow 로깅 (수정된 부분)
             try:
-                # 파라미터 로깅
-                mlflow.log_param("model_type", model_type)
-                mlflow.log_param("features", self.feature_names)
-                mlflow.log_param("n_features", len(self.feature_names))
-
-                # 메트릭 로깅
-                for metric_name, metric_value in metrics.items():
-                    mlflow.log_metric(metric_name, metric_value)
+                # 파라미터 / 메트릭 로깅 (각각 한 번의 배치 호출)
+                mlflow.log_params(
+                    {
+                        "model_type": model_type,
+                        "features": self.feature_names,
+                        "n_features": len(self.feature_names),
+                    }
+                )
+                mlflow.log_metrics(metrics)
 
                 # 🎯 모델 로깅 개선 (서명과 예제 추가)
                 input_example = pd.DataFrame(
                     X_train_scaled[:5], columns=self.feature_names
                 )
 
-                mlflow_sklearn.log_model(
-                    self.model,
-                    "model",
-                    input_example=input_example,
-                    registered_model_name=f"{model_type}_movie_rating",
-                )
+                # 모델 로깅 중 발생하는 경고(서명 추론 등)만 국소적으로 무시
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    mlflow_sklearn.log_model(
+                        self.model,
+                        "model",
+                        input_example=input_example,
+                        registered_model_name=f"{model_type}_movie_rating",
+                    )
 
                 logger.info("MLflow 로깅 완료")
 
@@ -200,7 +204,12 @@ def run_training_pipeline():
     try:
         # 데이터 로드
         data_path = "data/processed/movies_with_ratings.csv"
-        df = pd.read_csv(data_path)
+
+        # 훈련에 필요한 컬럼만 파싱 (피처 + 타겟)
+        required_columns = set(
+            MovieRatingTrainer.BASE_FEATURES + [MovieRatingTrainer.TARGET_COLUMN]
+        )
+        df = pd.read_csv(data_path, usecols=lambda col: col in required_columns)
 
         logger.info(f"데이터 로드 완료: {len(df):,}개 샘플")
 
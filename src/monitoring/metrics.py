@@ -4,6 +4,7 @@ Custom metrics for API, models, and data monitoring
 """
 
 import time
+import weakref
 from datetime import datetime
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Union
@@ -70,6 +71,13 @@ logger = logging.getLogger(__name__)
 class MLOpsMetrics:
     """Centralized metrics collection for MLOps pipeline"""
 
+    # Metric objects already registered on an explicit registry (weakly keyed).
+    # Re-creating them would raise "Duplicated timeseries" on the same registry.
+    # registry=None registers nothing, so those instances always get their own metrics.
+    _registered_metrics: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self, enabled: bool = True, registry: Optional[CollectorRegistry] = None
     ):
@@ -80,6 +88,16 @@ class MLOpsMetrics:
             logger.warning("Prometheus client not available. Metrics will be disabled.")
             return
 
+        # Reuse the metrics already registered on this registry
+        registered = (
+            MLOpsMetrics._registered_metrics.get(registry)
+            if registry is not None
+            else None
+        )
+        if registered is not None:
+            self.__dict__.update(registered)
+            return
+
         # API Performance Metrics
         self.http_requests_total = Counter(
             "http_requests_total",
@@ -195,6 +213,8 @@ class MLOpsMetrics:
             buckets=[1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
             registry=registry,
         )
+        # Labelled children by integer rating bucket (label string built once)
+        self._rating_range_children: Dict[int, Any] = {}
 
         self.api_users_active = Gauge(
             "api_users_active", "Number of active API users", registry=registry
@@ -208,6 +228,13 @@ class MLOpsMetrics:
         # Set application info
         self.set_app_info()
 
+        if registry is not None:
+            MLOpsMetrics._registered_metrics[registry] = {
+                name: value
+                for name, value in self.__dict__.items()
+                if name not in ("registry", "enabled")
+            }
+
         logger.info("MLOps metrics initialized successfully")
 
     def set_app_info(self):
@@ -271,6 +298,20 @@ class MLOpsMetrics:
         """Decorator to track model predictions"""
 
         def decorator(func):
+            if self.enabled:
+                # Resolve labelled children once per decorated function
+                duration_metric = self.model_prediction_duration_seconds.labels(
+                    model_name=model_name, model_version=model_version
+                )
+                predictions_metrics = {
+                    prediction_type: self.model_predictions_total.labels(
+                        model_name=model_name,
+                        model_version=model_version,
+                        prediction_type=prediction_type,
+                    )
+                    for prediction_type in ("single", "batch", "failed")
+                }
+
             @wraps(func)
             def wrapper(*args, **kwargs):
                 if not self.enabled:
@@ -294,15 +335,8 @@ class MLOpsMetrics:
                 finally:
                     duration = time.time() - start_time
 
-                    self.model_prediction_duration_seconds.labels(
-                        model_name=model_name, model_version=model_version
-                    ).observe(duration)
-
-                    self.model_predictions_total.labels(
-                        model_name=model_name,
-                        model_version=model_version,
-                        prediction_type=prediction_type,
-                    ).inc()
+                    duration_metric.observe(duration)
+                    predictions_metrics[prediction_type].inc()
 
             return wrapper
 
@@ -312,6 +346,12 @@ class MLOpsMetrics:
         """Decorator to track model training"""
 
         def decorator(func):
+            if self.enabled:
+                # Resolve the labelled duration child once per decorated function
+                duration_metric = self.model_training_duration_seconds.labels(
+                    model_name=model_name, training_type=training_type
+                )
+
             @wraps(func)
             def wrapper(*args, **kwargs):
                 if not self.enabled:
@@ -331,9 +371,7 @@ class MLOpsMetrics:
                     raise
                 finally:
                     duration = time.time() - start_time
-                    self.model_training_duration_seconds.labels(
-                        model_name=model_name, training_type=training_type
-                    ).observe(duration)
+                    duration_metric.observe(duration)
 
             return wrapper
 
@@ -345,12 +383,16 @@ class MLOpsMetrics:
         if not self.enabled:
             return
 
-        # Determine rating range
-        rating_range = f"{int(rating)}-{int(rating)+1}"
+        # Determine rating range (cached child per bucket)
+        bucket = int(rating)
+        child = self._rating_range_children.get(bucket)
+        if child is None:
+            child = self.prediction_ratings_distribution.labels(
+                rating_range=f"{bucket}-{bucket+1}"
+            )
+            self._rating_range_children[bucket] = child
 
-        self.prediction_ratings_distribution.labels(rating_range=rating_range).observe(
-            rating
-        )
+        child.observe(rating)
 
     def record_data_drift(
         self, feature_name: str, drift_score: float, model_name: str = "default"
@@ -484,59 +526,34 @@ def track_prediction_time(model_name: str = "imdb_model", model_version: str = "
     """Decorator to track prediction time"""
 
     def decorator(func: Callable) -> Callable:
+        # Resolve the labelled histogram child once, not on every prediction
+        try:
+            duration_metric = metrics.model_prediction_duration_seconds.labels(
+                model_name=model_name, model_version=model_version
+            )
+        except Exception as e:
+            logger.error(f"Failed to resolve prediction time metric: {e}")
+            duration_metric = None
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             start_time = time.time()
             try:
-                result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-
-                # Record the metric
-                try:
-                    metrics.model_prediction_duration_seconds.labels(
-                        model_name=model_name, model_version=model_version
-                    ).observe(duration)
-                except Exception as e:
-                    logger.error(f"Failed to record prediction time: {e}")
-
-                return result
-            except Exception as e:
-                duration = time.time() - start_time
-                # Record failed prediction time too
-                try:
-                    metrics.model_prediction_duration_seconds.labels(
-                        model_name=model_name, model_version=model_version
-                    ).observe(duration)
-                except:
-                    pass
-                raise
+                return await func(*args, **kwargs)
+            finally:
+                # Record successful and failed prediction time alike
+                if duration_metric is not None:
+                    duration_metric.observe(time.time() - start_time)
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             start_time = time.time()
             try:
-                result = func(*args, **kwargs)
-                duration = time.time() - start_time
-
-                # Record the metric
-                try:
-                    metrics.model_prediction_duration_seconds.labels(
-                        model_name=model_name, model_version=model_version
-                    ).observe(duration)
-                except Exception as e:
-                    logger.error(f"Failed to record prediction time: {e}")
-
-                return result
-            except Exception as e:
-                duration = time.time() - start_time
-                # Record failed prediction time too
-                try:
-                    metrics.model_prediction_duration_seconds.labels(
-                        model_name=model_name, model_version=model_version
-                    ).observe(duration)
-                except:
-                    pass
-                raise
+                return func(*args, **kwargs)
+            finally:
+                # Record successful and failed prediction time alike
+                if duration_metric is not None:
+                    duration_metric.observe(time.time() - start_time)
 
         # Return appropriate wrapper based on function type
         if asyncio.iscoroutinefunction(func):
@@ -674,9 +691,16 @@ class PrometheusMiddleware:
             ).observe(duration)
 
 
+# psutil.Process handle reused across health updates, so that its
+# non-blocking cpu_percent() has a previous sample to measure against
+_health_process = None
+
+
 # Health check metrics
 def update_health_metrics():
     """Update system health metrics"""
+    global _health_process
+
     if not metrics.enabled:
         return
 
@@ -686,7 +710,9 @@ def update_health_metrics():
         import psutil
 
         # Get current process
-        process = psutil.Process(os.getpid())
+        if _health_process is None or _health_process.pid != os.getpid():
+            _health_process = psutil.Process(os.getpid())
+        process = _health_process
 
         # Memory usage
         memory_info = process.memory_info()
@@ -697,8 +723,10 @@ def update_health_metrics():
         )
 
         # System-wide metrics
+        # interval=None is non-blocking (usage since the previous call); a 1s
+        # sampling interval would stall /health and the event loop every update
         system_memory = psutil.virtual_memory()
-        system_cpu = psutil.cpu_percent(interval=1)
+        system_cpu = psutil.cpu_percent(interval=None)
 
         metrics.record_resource_usage(
             component="system", memory_bytes=system_memory.used, cpu_percent=system_cpu
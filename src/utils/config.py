@@ -4,6 +4,14 @@ from typing import Any, Dict
 
 import yaml
 
+# libyaml 기반 C 로더/덤퍼 사용 (없으면 순수 Python 구현으로 대체)
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
 
 class Config:
     def __init__(self, config_path: str = None):
@@ -18,7 +26,7 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         if os.path.exists(self.config_path):
             with open(self.config_path, "r") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=YamlLoader) or {}
         return {}
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -30,7 +38,7 @@ class Config:
     def save(self) -> None:
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
         with open(self.config_path, "w") as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+            yaml.dump(self.config, f, Dumper=YamlDumper, default_flow_style=False)
 
 
 # Environment variables
@@ -3,6 +3,7 @@ import logging as builtin_logging
 import os
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
@@ -140,15 +141,7 @@ class ProgressTracker:
         """Rich progress context manager"""
         if self.use_rich and HAS_RICH:
             # Only use Progress when Rich is available
-            from rich.console import Console
-            from rich.progress import (
-                BarColumn,
-                Progress,
-                SpinnerColumn,
-                TaskProgressColumn,
-                TextColumn,
-            )
-
+            # (rich classes are imported once at module load)
             if isinstance(console, Console):
                 return Progress(
                     SpinnerColumn(),
@@ -213,8 +206,6 @@ def create_table(
         Either a Rich Table object (if Rich is available) or a string representation
     """
     if HAS_RICH:
-        from rich.table import Table
-
         table = Table(title=title)
         for header in headers:
             table.add_column(header)
@@ -269,8 +260,6 @@ class MLOpsTools:
 
         # Rich formatting if available
         if HAS_RICH:
-            from rich.panel import Panel
-
             console.print(
                 Panel(
                     f"[bold]Endpoint:[/bold] {endpoint}\n"
@@ -357,32 +346,45 @@ def debug(*args):
     ic(*args)
 
 
+@lru_cache(maxsize=None)
+def _get_enhanced_logger(name: str) -> EnhancedLogger:
+    """Shared EnhancedLogger per name (avoids re-creating one per log call)"""
+    return EnhancedLogger(name)
+
+
 def log_info(message: str):
     """Quick info logging"""
-    logger = EnhancedLogger("Utils")
+    logger = _get_enhanced_logger("Utils")
     logger.info(message)
 
 
 def log_success(message: str):
     """Quick success logging"""
-    logger = EnhancedLogger("Utils")
+    logger = _get_enhanced_logger("Utils")
     logger.success(message)
 
 
 def log_error(message: str):
     """Quick error logging"""
-    logger = EnhancedLogger("Utils")
+    logger = _get_enhanced_logger("Utils")
     logger.error(message)
 
 
+@lru_cache(maxsize=None)
+def _get_progress_tracker() -> ProgressTracker:
+    """Shared ProgressTracker for track_progress (created once, on first use)"""
+    return ProgressTracker()
+
+
 def track_progress(iterable, description: str = "Processing"):
     """Quick progress tracking"""
-    tracker = ProgressTracker()
+    tracker = _get_progress_tracker()
     return tracker.track(iterable, description)
 
 
+@lru_cache(maxsize=None)
 def get_package_version(package_name: str) -> str:
-    """Get version of any installed package"""
+    """Get version of any installed package (cached; installs don't change at runtime)"""
     try:
         from importlib.metadata import version
 
@@ -0,0 +1,43 @@
+"""
+IMDbDataLoader 단위 테스트
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.data.data_loader import IMDbDataLoader
+
+TITLE_RATINGS_TSV = (
+    "tconst\taverageRating\tnumVotes\n"
+    "tt0000001\t5.7\t2100\n"
+    "tt0000002\t\\N\t283\n"
+    "tt0000003\t6.5\t\\N\n"
+    "tt0000004\t5.4\t186\n"
+)
+
+
+def test_load_imdb_tsv_reads_gzip_like_text_mode_wrapper(tmp_path):
+    """gzip 파일을 직접 읽은 결과가 gzip.open 텍스트 래퍼로 읽은 결과와 같은지 확인"""
+    filepath = tmp_path / "title_ratings.tsv.gz"
+    with gzip.open(filepath, "wt", encoding="utf-8") as f:
+        f.write(TITLE_RATINGS_TSV)
+
+    # 파일이 이미 있으므로 다운로드 없이 로드
+    loader = IMDbDataLoader(data_dir=str(tmp_path))
+    df = loader.load_imdb_tsv("title_ratings")
+
+    with gzip.open(filepath, "rt", encoding="utf-8") as f:
+        expected = pd.read_csv(f, sep="\t", na_values="\\N")
+
+    pd.testing.assert_frame_equal(df, expected)
+    assert df["averageRating"].isna().sum() == 1
+
+    # nrows도 동일하게 적용
+    assert len(loader.load_imdb_tsv("title_ratings", nrows=2)) == 2
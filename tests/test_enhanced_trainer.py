@@ -0,0 +1,98 @@
+"""
+EnhancedMovieRatingTrainer 단위 테스트
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.models.enhanced_trainer import EnhancedMovieRatingTrainer
+
+
+@pytest.fixture(scope="module")
+def mlflow_tracking_uri(tmp_path_factory):
+    """모듈 전체에서 공유하는 임시 MLflow 저장소 (DB 초기화는 한 번만)"""
+    return f"sqlite:///{tmp_path_factory.mktemp('mlflow') / 'mlflow.db'}"
+
+
+@pytest.fixture
+def trainer(tmp_path, monkeypatch, mlflow_tracking_uri):
+    """models/ 디렉토리와 MLflow 저장소를 임시 디렉토리에 두는 트레이너"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", mlflow_tracking_uri)
+    return EnhancedMovieRatingTrainer(experiment_name="test_enhanced_trainer")
+
+
+@pytest.mark.parametrize("n_estimators", [5, 10, 100, 105])
+def test_fit_forest_in_steps_reaches_configured_n_estimators(trainer, n_estimators):
+    """warm_start 단계 훈련이 설정된 n_estimators 개수만큼 트리를 만드는지 확인"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 3)).astype(np.float32)
+    y = rng.uniform(1, 10, size=60)
+
+    trainer.model = RandomForestRegressor(
+        n_estimators=n_estimators, max_depth=3, random_state=42
+    )
+    trainer._fit_forest_in_steps(X, y)
+
+    assert len(trainer.model.estimators_) == n_estimators
+    assert trainer.model.n_estimators == n_estimators
+    assert trainer.model.warm_start is False
+
+
+@pytest.fixture
+def movies_csv(tmp_path):
+    """훈련 컬럼 외의 컬럼과 결측값이 섞인 작은 영화 CSV"""
+    path = tmp_path / "movies_with_ratings.csv"
+    pd.DataFrame(
+        {
+            "tconst": ["tt01", "tt02", "tt03", "tt04", "tt05", "tt06"],
+            "primaryTitle": ["A", "B, the sequel", "C", "D", "E", "F"],
+            "startYear": [1994, None, 2010, 2021, 1975, 2003],
+            "runtimeMinutes": [142, 95, None, 88, 120, 101],
+            "numVotes": [2_500_000, 120, 45_000, 7, 310, 98_765],
+            "genres": ["Drama", "Comedy,Romance", None, "Horror", "Drama", "Action"],
+            "averageRating": [9.3, 6.1, 7.4, 3.2, 8.0, 6.6],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def test_load_data_reads_only_training_columns_as_float32(trainer, movies_csv):
+    """load_data가 훈련 컬럼만 float32 피처로 읽는지 확인"""
+    df = trainer.load_data(str(movies_csv))
+
+    assert set(df.columns) == set(trainer.BASE_FEATURES + [trainer.TARGET_COLUMN])
+    assert all(df[feature].dtype == np.float32 for feature in trainer.BASE_FEATURES)
+
+
+def test_load_data_prepare_features_matches_full_read(trainer, movies_csv):
+    """load_data -> prepare_features 결과가 전체 컬럼 기본 read_csv 경로와 같은지 확인"""
+    X, y = trainer.prepare_features(trainer.load_data(str(movies_csv)))
+
+    # 기준 경로: 모든 컬럼을 기본 dtype(float64)으로 읽고 중앙값으로 결측값 채움
+    reference = pd.read_csv(movies_csv)
+    X_reference = reference[trainer.BASE_FEATURES]
+    X_reference = X_reference.fillna(X_reference.median()).to_numpy()
+    y_reference = reference[trainer.TARGET_COLUMN].to_numpy()
+
+    assert trainer.feature_names == trainer.BASE_FEATURES
+    assert X.dtype == np.float32
+    assert X.shape == X_reference.shape
+    np.testing.assert_allclose(X, X_reference, rtol=1e-6)
+    np.testing.assert_array_equal(y, y_reference)
+
+
+def test_load_data_only_features_false_keeps_all_columns(trainer, movies_csv):
+    """only_features=False이면 기존처럼 모든 컬럼을 읽는지 확인"""
+    df = trainer.load_data(str(movies_csv), only_features=False)
+
+    assert list(df.columns) == list(pd.read_csv(movies_csv).columns)